@@ -1,15 +1,21 @@
 """The init-file for the Krisinformation integration."""
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 import logging
 
 # Importing necessary modules and classes.
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 # Importing custom constants and logger from the integration.
-from .const import DOMAIN
+from .api import CrisisAlerter
+from .const import COORDINATOR, DEFAULT_SCAN_INTERVAL, DOMAIN, SETUP_LOCK
+from .coordinator import STORAGE_KEY, STORAGE_VERSION, KrisinformationCoordinator
 
 # List of the platforms that the integration supports.
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.GEO_LOCATION]
@@ -20,7 +26,32 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Asynchronous function to set up the krisinformation integration when a configuration entry is added."""
 
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    # The VMA feed covers all counties, so every entry shares one coordinator.
+    # Entries are set up concurrently, only the first one may create it.
+    async with domain_data.setdefault(SETUP_LOCK, asyncio.Lock()):
+        if (coordinator := domain_data.get(COORDINATOR)) is None:
+            coordinator = KrisinformationCoordinator(
+                hass,
+                CrisisAlerter(
+                    async_get_clientsession(hass), language=hass.config.language
+                ),
+                timedelta(
+                    seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                ),
+            )
+            try:
+                if not await coordinator.async_restore_last_fetch():
+                    await coordinator.async_config_entry_first_refresh()
+            except Exception:
+                await coordinator.async_shutdown()
+                raise
+            domain_data[COORDINATOR] = coordinator
+
+    domain_data[entry.entry_id] = coordinator
+    _async_update_scan_interval(hass)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     _LOGGER.debug("Feed entity manager added for %s", entry.entry_id)
 
@@ -32,26 +63,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Asynchronous function to unload the integration when a configuration entry is removed."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id)
+        if _async_loaded_entries(hass):
+            _async_update_scan_interval(hass)
+        else:
+            await domain_data.pop(COORDINATOR).async_shutdown()
 
     return unload_ok
 
 
-def generate_mock_event(identifier, headline):
-    """Create mock event for testing."""
-    return {
-        "Identifier": identifier,
-        "Headline": headline,
-        "Area": [
-            {
-                "Type": "County",
-                "Description": "Värmlands län",
-                "GeometryInformation": {
-                    "PoleOfInInaccessibility": {"coordinates": [57.7, 9.11]}
-                },
-            }
-        ],
-        "Web": "krisinformation.se",
-        "Published": "2023-03-29T11:02:11+02:00",
-        "PushMessage": "Test message",
-    }
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored feed when the last configuration entry is removed."""
+    if any(
+        other.entry_id != entry.entry_id
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        return
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY).async_remove()
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options without reloading the entry."""
+    _async_update_scan_interval(hass)
+
+
+@callback
+def _async_update_scan_interval(hass: HomeAssistant) -> None:
+    """Poll the shared feed at the shortest scan interval of the set up entries."""
+    hass.data[DOMAIN][COORDINATOR].update_interval = timedelta(
+        seconds=min(
+            entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            for entry in _async_loaded_entries(hass)
+        )
+    )
+
+
+@callback
+def _async_loaded_entries(hass: HomeAssistant) -> list[ConfigEntry]:
+    """Return the entries currently sharing the coordinator."""
+    domain_data = hass.data[DOMAIN]
+    return [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in domain_data
+    ]
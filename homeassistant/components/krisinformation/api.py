@@ -0,0 +1,89 @@
+"""Async client for the Krisinformation API."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from http import HTTPStatus
+from typing import Any, cast
+
+import aiohttp
+from aiohttp import hdrs
+from krisinformation.crisis_alerter import API_BASE_URL, Error
+
+from homeassistant.util.json import json_loads_array
+
+# Endpoint returning the currently active VMAs (Important Public Announcements).
+VMAS_URL = f"{API_BASE_URL}vmas"
+
+# Maximum time in seconds to wait for the Krisinformation API.
+REQUEST_TIMEOUT = 10
+
+# Largest VMA feed accepted, the feed is normally a few tens of kilobytes.
+MAX_PAYLOAD_BYTES = 256 * 1024
+
+
+class CrisisAlerter:
+    """Crisis alerter that fetches VMAs over Home Assistant's aiohttp session."""
+
+    def __init__(self, session: aiohttp.ClientSession, language: str = "sv") -> None:
+        """Initialize the crisis alerter with a shared client session."""
+        self._session = session
+        self.language = language
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._payload_hash: bytes | None = None
+
+    def reset(self) -> None:
+        """Forget the last fetched feed so the next fetch returns it in full."""
+        self._etag = None
+        self._last_modified = None
+        self._payload_hash = None
+
+    async def async_vmas(self) -> list[dict[str, Any]] | None:
+        """Fetch VMA from Krisinformation without blocking the event loop.
+
+        Returns None when the feed is unchanged since the previous fetch, either
+        reported by the server or detected from the payload itself.
+        """
+        headers: dict[str, str] = {}
+        if self._etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        if self._last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+
+        async with asyncio.timeout(REQUEST_TIMEOUT), self._session.get(
+            VMAS_URL,
+            params={"language": self.language, "format": "json"},
+            headers=headers,
+        ) as response:
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                return None
+            if response.status != HTTPStatus.OK:
+                raise Error(f"Error: {response.status} {await response.text()}")
+            content_length = response.headers.get(hdrs.CONTENT_LENGTH)
+            if content_length is not None and int(content_length) > MAX_PAYLOAD_BYTES:
+                raise Error(f"Error: response of {content_length} bytes is too large")
+            # Chunked and compressed responses have no Content-Length, stop
+            # reading as soon as the body goes over the cap.
+            content = response.content
+            body = b""
+            while chunk := await content.read(MAX_PAYLOAD_BYTES + 1 - len(body)):
+                body += chunk
+                if len(body) > MAX_PAYLOAD_BYTES:
+                    raise Error(
+                        f"Error: response of over {MAX_PAYLOAD_BYTES} bytes is too large"
+                    )
+            etag = response.headers.get(hdrs.ETAG)
+            last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+
+        # Not used for security, only to skip parsing an identical payload.
+        payload_hash = hashlib.blake2b(body, digest_size=16).digest()
+        if payload_hash == self._payload_hash:
+            self._etag, self._last_modified = etag, last_modified
+            return None
+        vmas = cast(list[dict[str, Any]], json_loads_array(body))
+        # Only remember the validators of a response that could be parsed, so a
+        # broken payload is never confirmed by a later 304.
+        self._etag, self._last_modified = etag, last_modified
+        self._payload_hash = payload_hash
+        return vmas
@@ -1,12 +1,18 @@
 """Custom constants for the krisinformation integration."""
 DOMAIN = "krisinformation"
 FEED = "feed"
+COORDINATOR = "coordinator"
+SETUP_LOCK = "setup_lock"
 
 DEFAULT_NAME = "Krisinformation"
 COUNTY_NAME = "Krisinformation County"
 CONF_COUNTY = "county"
 LANGUAGES = ["sv", "en"]
 
+# Scan interval of the VMA feed in seconds.
+DEFAULT_SCAN_INTERVAL = 300
+MIN_SCAN_INTERVAL = 60
+
 """County codes that represents the counties in Sweden."""
 COUNTY_CODES = {
     "01": "Stockholms län",
@@ -0,0 +1,153 @@
+"""Data update coordinator for the krisinformation integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+from typing import Any, NamedTuple
+
+import aiohttp
+from krisinformation import crisis_alerter as krisinformation
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import homeassistant.util.dt as dt_util
+
+from .api import CrisisAlerter
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Storage of the last fetched feed, used to avoid refetching on reloads and restarts.
+STORAGE_KEY = f"{DOMAIN}.last_fetch"
+STORAGE_VERSION = 1
+# Unchanged polls only move the fetch time forward. Delay that write so it is
+# normally flushed when Home Assistant stops or the coordinator shuts down.
+STORAGE_SAVE_DELAY = 3600
+
+
+class Alert(NamedTuple):
+    """The fields of a VMA shown by the county sensors."""
+
+    msg: str
+    web: str
+    published: str
+    area: str
+
+
+class KrisinformationData(NamedTuple):
+    """VMAs from the feed together with the first alert for each county."""
+
+    vmas: list[dict[str, Any]]
+    by_county: dict[str, Alert]
+
+
+class KrisinformationCoordinator(DataUpdateCoordinator[KrisinformationData]):
+    """Fetch the VMA feed once per update for all configured counties."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        crisis_alerter: CrisisAlerter,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=update_interval,
+            # An unchanged feed returns the previous data, skip notifying.
+            always_update=False,
+        )
+        self.crisis_alerter = crisis_alerter
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._last_fetch: float | None = None
+        self._unsub_restored_refresh: Callable[[], None] | None = None
+
+    async def async_restore_last_fetch(self) -> bool:
+        """Restore the last fetched feed if it is too recent to fetch again.
+
+        Returns True when the stored feed was restored and the first refresh
+        can be skipped.
+        """
+        if (stored := await self._store.async_load()) is None:
+            return False
+        assert self.update_interval is not None
+        next_fetch = stored["last_fetch"] + self.update_interval.total_seconds()
+        if (wait := next_fetch - dt_util.utcnow().timestamp()) <= 0:
+            return False
+
+        _LOGGER.debug("Using VMAs fetched at %s", stored["last_fetch"])
+        self._last_fetch = stored["last_fetch"]
+        self.async_set_updated_data(_index_by_county(stored["vmas"]))
+        # The regular schedule starts a full interval from now, fetch when the
+        # stored feed is due instead so repeated reloads cannot postpone it.
+        self._unsub_restored_refresh = async_call_later(
+            self.hass, wait, self._async_refresh_restored
+        )
+        return True
+
+    async def _async_refresh_restored(self, _now: datetime) -> None:
+        """Refresh the restored feed once it is due."""
+        self._unsub_restored_refresh = None
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Write the last fetch time and stop updating."""
+        if self._unsub_restored_refresh is not None:
+            self._unsub_restored_refresh()
+            self._unsub_restored_refresh = None
+        await super().async_shutdown()
+        if self._last_fetch is not None:
+            await self._store.async_save(self._data_to_save())
+
+    async def _async_update_data(self) -> KrisinformationData:
+        """Get the latest VMAs from Krisinformation."""
+        try:
+            vmas = await self.crisis_alerter.async_vmas()
+        except (
+            krisinformation.Error,
+            aiohttp.ClientError,
+            TimeoutError,
+            ValueError,
+        ) as error:
+            raise UpdateFailed(f"Error fetching data: {error}") from error
+
+        self._last_fetch = dt_util.utcnow().timestamp()
+        if vmas is None:
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+            return self.data
+
+        try:
+            data = _index_by_county(vmas)
+        except (KeyError, TypeError) as error:
+            # The feed parsed but its items did not, do not let a later 304 or
+            # identical payload report the previous data as a good update.
+            self.crisis_alerter.reset()
+            raise UpdateFailed(f"Error parsing data: {error!r}") from error
+        await self._store.async_save(
+            {"last_fetch": self._last_fetch, "vmas": data.vmas}
+        )
+        return data
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the last fetched feed to store."""
+        return {"last_fetch": self._last_fetch, "vmas": self.data.vmas}
+
+
+def _index_by_county(vmas: list[dict[str, Any]]) -> KrisinformationData:
+    """Index the VMAs once per fetch so each county sensor does a single lookup."""
+    by_county: dict[str, Alert] = {}
+    for news in vmas:
+        if not news["Area"]:
+            continue
+        county = news["Area"][0]["Description"]
+        if county not in by_county:
+            by_county[county] = Alert(
+                news["PushMessage"], news["Web"], news["Published"], county
+            )
+    return KrisinformationData(vmas, by_county)
@@ -1,23 +1,17 @@
 """Support for geolocation data from Krisinformation."""
-from datetime import timedelta
 from typing import Any
 
-from krisinformation import crisis_alerter as krisinformation
-
 # Importing necessary modules and classes.
 from homeassistant.components.geo_location import GeolocationEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_START, UnitOfLength
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.const import UnitOfLength
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import DiscoveryInfoType
 
 # Import custom costants and logger from the integration.
-from .const import CONF_COUNTY
-
-# Minimum time between updates for geolocation events.
-MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=120)
+from .const import DOMAIN
+from .coordinator import KrisinformationCoordinator
 
 # Source identifier for Krisinformation geolocation events.
 SOURCE = "krisinformation"
@@ -26,6 +20,18 @@ SOURCE = "krisinformation"
 class KrisInformationGeolocationEvent(GeolocationEvent):
     """Custom GeolocationEvent class representing a demo Krisinformation geo-location event."""
 
+    # One event is created per VMA on every update, keep their attributes compact.
+    __slots__ = (
+        "_external_id",
+        "_latitude",
+        "_longitude",
+        "_unit_of_measurement",
+        "_web",
+        "_published",
+        "_area",
+        "_state",
+    )
+
     _attr_should_poll = False
     _attr_source = SOURCE
     _attr_icon = "mdi:public"
@@ -95,17 +101,11 @@ async def async_setup_entry(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Responsible for setting up the Demo geolocations when a configuration entry is added to Home Assistant."""
-    manager = KrisInformationGeolocationManager(
-        hass,
-        async_add_entities,
-        krisinformation.CrisisAlerter(config.data.get(CONF_COUNTY)),
-    )
+    coordinator: KrisinformationCoordinator = hass.data[DOMAIN][config.entry_id]
+    manager = KrisInformationGeolocationManager(hass, async_add_entities, coordinator)
 
-    async def start_feed_manager(event: Event) -> None:
-        """Start feed manager."""
-        await manager.init_regular_updates()
-
-    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, start_feed_manager)
+    manager.async_update()
+    config.async_on_unload(coordinator.async_add_listener(manager.async_update))
 
 
 class KrisInformationGeolocationManager:
@@ -115,37 +115,28 @@ class KrisInformationGeolocationManager:
         self,
         hass: HomeAssistant,
         async_add_entities: AddEntitiesCallback,
-        crisis_alerter: krisinformation.CrisisAlerter,
+        coordinator: KrisinformationCoordinator,
     ) -> None:
         """Initialise the krisinformation geolocation event manager."""
         self._hass = hass
         self._async_add_entities = async_add_entities
         self._events: list[KrisInformationGeolocationEvent] = []
-        self._crisis_alerter = crisis_alerter
-
-    async def init_regular_updates(self) -> None:
-        """Initiate the scheduling of regular updates for geolocation events. Uses track_time_interval to schedule subsequent updates at fixed intervals."""
-        await self._update()
+        self._coordinator = coordinator
 
-        async_track_time_interval(
-            self._hass,
-            self._update,
-            MIN_TIME_BETWEEN_UPDATES,
-            cancel_on_shutdown=True,
-        )
+    @callback
+    def async_update(self) -> None:
+        """Replace the existing geolocation events with the VMAs from the coordinator."""
+        if not self._coordinator.last_update_success:
+            # Keep the current events until the feed can be fetched again.
+            return
 
-    async def _update(self, _=None) -> None:
-        """Clear the existing list of geolocation events and fetches new geolocation events from the CrisisAlerter (Krisinformation API)."""
         new_events = []
         for existing_event in self._events:
-            self._hass.add_job(existing_event.async_remove())
-
-        def getvmas():
-            return self._crisis_alerter.vmas()
-
-        events = await self._hass.async_add_executor_job(getvmas)
+            self._hass.async_create_task(existing_event.async_remove())
 
-        for event in events:
+        for event in self._coordinator.data.vmas:
+            if not event["Area"]:
+                continue
             new_event = KrisInformationGeolocationEvent(
                 event["Identifier"],
                 event["Headline"],
@@ -1,35 +1,27 @@
 """Support for Krisinformation sensor."""
-from datetime import timedelta
+from functools import lru_cache
 import logging
 from typing import Any
 
-from krisinformation import crisis_alerter as krisinformation
-
 # Importing necessary modules and classes.
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_NAME, MAX_LENGTH_STATE_STATE
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 # Import custom costants
-from .const import CONF_COUNTY, DEFAULT_NAME
+from .const import CONF_COUNTY, DEFAULT_NAME, DOMAIN
+from .coordinator import KrisinformationCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# Minimum time between updates for geolocation events.
-MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=120)
-
 # String literals for the sensor.
 NO_ALARM_SV = "Inga larm"
 NO_ALARM_EN = "No alarms"
 
 
-class Error(Exception):
-    """Base class for exceptions in this module."""
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config: ConfigEntry,
@@ -38,37 +30,49 @@ async def async_setup_entry(
     """Set up the sensor associated with the Krisinformation integration when a configuration entry is added to Home Assistant."""
     name = config.data.get(CONF_NAME, DEFAULT_NAME + " - Sweden")
     county = config.data[CONF_COUNTY]
-    language = hass.config.language
+    coordinator: KrisinformationCoordinator = hass.data[DOMAIN][config.entry_id]
 
-    crisis_alerter = krisinformation.CrisisAlerter(county, language)
-
-    sensor = CrisisAlerterSensorCounty(hass, config.entry_id, name, crisis_alerter)
+    sensor = CrisisAlerterSensorCounty(config.entry_id, name, coordinator, county)
 
     async_add_entities([sensor], False)
 
 
-class CrisisAlerterSensorCounty(SensorEntity):
+class CrisisAlerterSensorCounty(
+    CoordinatorEntity[KrisinformationCoordinator], SensorEntity
+):
     """Implementation of Krisinformations crisis alerter sensor."""
 
+    # Entity base classes keep a __dict__, slots still keep these out of it.
+    __slots__ = (
+        "_county",
+        "_no_alarm_text",
+        "_web",
+        "_published",
+        "_area",
+    )
+
     _attr_attribution = "Alerts provided by Krisinformation"
     _attr_icon = "mdi:alert"
 
     def __init__(
         self,
-        hass: HomeAssistant,
         unique_id: str,
         name: str,
-        crisis_alerter: krisinformation.CrisisAlerter,
+        coordinator: KrisinformationCoordinator,
+        county: str,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
         self._attr_unique_id = unique_id
         self._attr_name = name
-        self._hass = hass
-        self._crisis_alerter = crisis_alerter
-        self._state: str | None = None
+        self._county = county
+        self._no_alarm_text = (
+            NO_ALARM_SV if coordinator.crisis_alerter.language == "sv" else NO_ALARM_EN
+        )
         self._web: str | None = None
         self._published: str | None = None
         self._area: str | None = None
+        self._update_from_coordinator()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -79,57 +83,33 @@ class CrisisAlerterSensorCounty(SensorEntity):
             "county": self._area,
         }
 
-    async def async_added_to_hass(self) -> None:
-        """Handle when entity is added. Listens for the Home Assistant startup event and triggers the first_update method accordingly."""
-        await self._init_updates()
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the sensor."""
-        return self._attr_name
-
-    @property
-    def state(self):
-        """Return the current state of the sensor."""
-        return self._state
-
-    async def _init_updates(self):
-        """Run first update and write state. Initiates the first update and writes the state to Home Assistant."""
-        await self._update()
-        async_track_time_interval(
-            self.hass, self._update, MIN_TIME_BETWEEN_UPDATES, cancel_on_shutdown=True
-        )
-
-    async def _update(self, _=None) -> None:
-        """Get the latest alerts. Fetches the latest crisis alerts from Krisinformation for the specified county and extracts relevant information."""
-        try:
-
-            def getvmas():
-                return self._crisis_alerter.vmas()
-
-            response = await self.hass.async_add_executor_job(getvmas)
-            location = self._crisis_alerter.county
-            if len(response) > 0:
-                for news in response:
-                    county = news["Area"][0]["Description"]
-                    if county == location:
-                        self._state = news["PushMessage"][:255]  # Crashes if not capped
-                        self._web = news["Web"]
-                        self._published = news["Published"]
-                        self._area = county
-                        break
-                    self._state = (
-                        NO_ALARM_SV
-                        if self._crisis_alerter.language == "sv"
-                        else NO_ALARM_EN
-                    )
-
-            else:
-                self._state = (
-                    NO_ALARM_SV
-                    if self._crisis_alerter.language == "sv"
-                    else NO_ALARM_EN
-                )
-        except Error as error:
-            _LOGGER.error("Error fetching data: %s", error)
-            self._state = "Unavailable"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Select the latest alert for the specified county from the coordinator data."""
+        alert = self.coordinator.data.by_county.get(self._county)
+        if alert is None:
+            self._attr_native_value = self._no_alarm_text
+            self._web = self._published = self._area = None
+        else:
+            self._attr_native_value = _truncate_state(alert.msg)
+            self._web = alert.web
+            self._published = alert.published
+            self._area = alert.area
+
+
+@lru_cache(maxsize=32)
+def _truncate_state(message: str) -> str:
+    """Cap the message to the maximum state length, logging once per message."""
+    if len(message) <= MAX_LENGTH_STATE_STATE:
+        return message
+    _LOGGER.debug(
+        "Truncating VMA message of %s characters to %s",
+        len(message),
+        MAX_LENGTH_STATE_STATE,
+    )
+    return message[:MAX_LENGTH_STATE_STATE]
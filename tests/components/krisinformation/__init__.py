@@ -1 +1,21 @@
 """Tests for the krisinformation integration."""
+
+
+def generate_mock_event(identifier, headline):
+    """Create mock event for testing."""
+    return {
+        "Identifier": identifier,
+        "Headline": headline,
+        "Area": [
+            {
+                "Type": "County",
+                "Description": "Värmlands län",
+                "GeometryInformation": {
+                    "PoleOfInInaccessibility": {"coordinates": [57.7, 9.11]}
+                },
+            }
+        ],
+        "Web": "krisinformation.se",
+        "Published": "2023-03-29T11:02:11+02:00",
+        "PushMessage": "Test message",
+    }
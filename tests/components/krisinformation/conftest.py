@@ -4,6 +4,13 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from homeassistant.components.krisinformation.const import DOMAIN
+from homeassistant.core import HomeAssistant
+
+from .const import MOCK_CONFIG
+
+from tests.common import MockConfigEntry
+
 
 @pytest.fixture
 def mock_setup_entry() -> Generator[AsyncMock, None, None]:
@@ -12,3 +19,16 @@ def mock_setup_entry() -> Generator[AsyncMock, None, None]:
         "homeassistant.components.krisinformation.async_setup_entry", return_value=True
     ) as mock_setup_entry:
         yield mock_setup_entry
+
+
+@pytest.fixture(name="config_entry")
+def config_entry_fixture(hass: HomeAssistant) -> MockConfigEntry:
+    """Define a config entry fixture."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG,
+        title="Krisinformation",
+        unique_id=123456789,
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -6,9 +6,14 @@ from voluptuous import MultipleInvalid
 
 from homeassistant import config_entries
 from homeassistant.components.krisinformation.const import COUNTY_CODES, DOMAIN
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
+from .const import MOCK_CONFIG
+
+from tests.common import MockConfigEntry
+
 pytestmark = pytest.mark.usefixtures("mock_setup_entry")
 
 
@@ -56,3 +61,24 @@ async def test_config_invalid_county(hass: HomeAssistant) -> None:
         )
 
     assert result["errors"] == {}
+
+
+async def test_options_flow(hass: HomeAssistant) -> None:
+    """Test the scan interval can be changed in the options flow."""
+    config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    with pytest.raises(MultipleInvalid):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], user_input={CONF_SCAN_INTERVAL: 10}
+        )
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_SCAN_INTERVAL: 600}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {CONF_SCAN_INTERVAL: 600}
@@ -0,0 +1,256 @@
+"""Tests for the krisinformation coordinator."""
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.krisinformation.api import MAX_PAYLOAD_BYTES, VMAS_URL
+from homeassistant.components.krisinformation.const import DEFAULT_SCAN_INTERVAL
+from homeassistant.components.krisinformation.coordinator import STORAGE_KEY
+from homeassistant.components.krisinformation.geo_location import (
+    KrisInformationGeolocationManager,
+)
+from homeassistant.components.krisinformation.sensor import CrisisAlerterSensorCounty
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_array
+
+from . import generate_mock_event
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.test_util.aiohttp import AiohttpClientMocker, AiohttpClientMockResponse
+
+SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+
+async def test_feed_not_modified(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test the sensor keeps its state when the feed is not modified."""
+    utcnow = dt_util.utcnow()
+    aioclient_mock.get(
+        VMAS_URL,
+        json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")],
+        headers={"ETag": '"1337"'},
+    )
+    with freeze_time(utcnow):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        entity_id = hass.states.async_entity_ids("sensor")[0]
+        assert hass.states.get(entity_id).state == "Test message"
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.get(VMAS_URL, status=HTTPStatus.NOT_MODIFIED)
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 1
+        assert aioclient_mock.mock_calls[0][3]["If-None-Match"] == '"1337"'
+        assert hass.states.get(entity_id).state == "Test message"
+
+
+async def test_recent_fetch_restored(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test a recently fetched feed is restored instead of fetched again."""
+    utcnow = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "last_fetch": (utcnow - timedelta(seconds=60)).timestamp(),
+            "vmas": [generate_mock_event("Test-VMA-1337-1", "Test VMA 1")],
+        },
+    }
+    aioclient_mock.get(VMAS_URL, json=[])
+    with freeze_time(utcnow) as frozen_time:
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 0
+        entity_id = hass.states.async_entity_ids("sensor")[0]
+        assert hass.states.get(entity_id).state == "Test message"
+
+        # The feed is due one interval after it was fetched, not after restoring.
+        frozen_time.move_to(utcnow + SCAN_INTERVAL - timedelta(seconds=60))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 1
+        assert hass.states.get(entity_id).state == "No alarms"
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("body", "headers"),
+    [
+        (
+            json_dumps([generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]),
+            {"Content-Length": str(1024 * 1024)},
+        ),
+        (f"[{' ' * MAX_PAYLOAD_BYTES}]", None),
+    ],
+    ids=["content_length", "streamed"],
+)
+async def test_oversized_feed(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    body: str,
+    headers: dict[str, str] | None,
+) -> None:
+    """Test an oversized feed is rejected without being parsed."""
+    aioclient_mock.get(VMAS_URL, text=body, headers=headers)
+
+    with patch(
+        "homeassistant.components.krisinformation.api.json_loads_array"
+    ) as mock_loads:
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+    mock_loads.assert_not_called()
+
+
+async def test_identical_payload_skipped(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test an identical payload without validators is not parsed or propagated."""
+    utcnow = dt_util.utcnow()
+    aioclient_mock.get(
+        VMAS_URL, json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]
+    )
+    with freeze_time(utcnow), patch(
+        "homeassistant.components.krisinformation.api.json_loads_array",
+        wraps=json_loads_array,
+    ) as mock_loads, patch.object(
+        CrisisAlerterSensorCounty,
+        "_handle_coordinator_update",
+        autospec=True,
+    ) as mock_sensor_update, patch.object(
+        KrisInformationGeolocationManager,
+        "async_update",
+        autospec=True,
+    ) as mock_geo_update:
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert mock_loads.call_count == 1
+        mock_sensor_update.reset_mock()
+        mock_geo_update.reset_mock()
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 2
+        assert mock_loads.call_count == 1
+        mock_sensor_update.assert_not_called()
+        mock_geo_update.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("body", "validator"),
+    [
+        ('{"broken', '"1"'),
+        (json_dumps([{"Area": [{"Description": "Värmlands län"}]}]), None),
+    ],
+    ids=["invalid_json", "invalid_vma"],
+)
+async def test_malformed_feed_not_confirmed_by_not_modified(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    body: str,
+    validator: str | None,
+) -> None:
+    """Test the validators of a malformed feed are not sent on the next poll."""
+
+    async def malformed_feed(method, url, data):
+        """Answer 304 only to requests validated against the malformed feed."""
+        if aioclient_mock.mock_calls[-1][3].get("If-None-Match") == '"2"':
+            return AiohttpClientMockResponse(
+                method, url, status=HTTPStatus.NOT_MODIFIED
+            )
+        return AiohttpClientMockResponse(
+            method, url, text=body, headers={"ETag": '"2"'}
+        )
+
+    utcnow = dt_util.utcnow()
+    aioclient_mock.get(VMAS_URL, json=[], headers={"ETag": '"1"'})
+    with freeze_time(utcnow):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        entity_id = hass.states.async_entity_ids("sensor")[0]
+        assert hass.states.get(entity_id).state == "No alarms"
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.get(VMAS_URL, side_effect=malformed_feed)
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL * 2)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 2
+        assert aioclient_mock.mock_calls[-1][3].get("If-None-Match") == validator
+        assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+
+async def test_unchanged_feed_save_delayed(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test an unchanged feed does not rewrite the stored feed on every poll."""
+    utcnow = dt_util.utcnow()
+    aioclient_mock.get(
+        VMAS_URL,
+        json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")],
+        headers={"ETag": '"1337"'},
+    )
+    with freeze_time(utcnow):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    stored = hass_storage[STORAGE_KEY]["data"]
+    assert stored["last_fetch"] == utcnow.timestamp()
+    assert len(stored["vmas"]) == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(VMAS_URL, status=HTTPStatus.NOT_MODIFIED)
+
+    next_poll = utcnow + SCAN_INTERVAL
+    with freeze_time(next_poll):
+        async_fire_time_changed(hass, next_poll)
+        await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert hass_storage[STORAGE_KEY]["data"] is stored
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    stored = hass_storage[STORAGE_KEY]["data"]
+    assert stored["last_fetch"] == next_poll.timestamp()
+    assert len(stored["vmas"]) == 1
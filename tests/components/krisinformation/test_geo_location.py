@@ -1,24 +1,26 @@
 """The tests for the krisinformation geo_location."""
-from unittest.mock import patch
+from datetime import timedelta
 
 from freezegun import freeze_time
 
 from homeassistant.components import geo_location
-from homeassistant.components.krisinformation import generate_mock_event
-from homeassistant.components.krisinformation.geo_location import (
-    MIN_TIME_BETWEEN_UPDATES,
-)
-from homeassistant.const import EVENT_HOMEASSISTANT_START, UnitOfLength
+from homeassistant.components.krisinformation.api import VMAS_URL
+from homeassistant.components.krisinformation.const import DEFAULT_SCAN_INTERVAL
+from homeassistant.const import UnitOfLength
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.components.krisinformation import generate_mock_event
 from tests.components.krisinformation.const import MOCK_CONFIG
+from tests.test_util.aiohttp import AiohttpClientMocker
 
 
 async def test_entity_lifecycle(
-    hass: HomeAssistant, entity_registry: er.EntityRegistry
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    aioclient_mock: AiohttpClientMocker,
 ) -> None:
     """Test the general setup of the integration."""
     config_entry = MockConfigEntry(
@@ -29,23 +31,16 @@ async def test_entity_lifecycle(
     )
 
     config_entry.add_to_hass(hass)
+    aioclient_mock.get(
+        VMAS_URL, json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]
+    )
 
     # Patching 'utcnow' to gain more control over the timed update.
     utcnow = dt_util.utcnow()
-    with freeze_time(utcnow), patch(
-        "krisinformation.crisis_alerter.CrisisAlerter.vmas", is_test=True
-    ) as mock_feed_update:
-        mock_feed_update.return_value = [
-            generate_mock_event("Test-VMA-1337-1", "Test VMA 1")
-        ]
-
+    with freeze_time(utcnow):
         assert await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
 
-        # # Artificially trigger update and collect events.
-        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
-        await hass.async_block_till_done()
-
         # 1 geolocation and 1 sensor entities
         assert (
             len(hass.states.async_entity_ids("geo_location"))
@@ -76,11 +71,15 @@ async def test_entity_lifecycle(
         }
 
         # Simulate an update - two existing, one new entry, one outdated entry
-        mock_feed_update.return_value = [
-            generate_mock_event("Test-VMA-1337-1", "Test VMA 1"),
-            generate_mock_event("Test-VMA-1337-2", "Test VMA 2"),
-        ]
-        async_fire_time_changed(hass, utcnow + MIN_TIME_BETWEEN_UPDATES)
+        aioclient_mock.clear_requests()
+        aioclient_mock.get(
+            VMAS_URL,
+            json=[
+                generate_mock_event("Test-VMA-1337-1", "Test VMA 1"),
+                generate_mock_event("Test-VMA-1337-2", "Test VMA 2"),
+            ],
+        )
+        async_fire_time_changed(hass, utcnow + timedelta(seconds=DEFAULT_SCAN_INTERVAL))
         await hass.async_block_till_done()
 
         state = [
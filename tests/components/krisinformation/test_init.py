@@ -0,0 +1,142 @@
+"""Tests for the krisinformation integration setup."""
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+
+from homeassistant.components.krisinformation.api import VMAS_URL
+from homeassistant.components.krisinformation.const import (
+    CONF_COUNTY,
+    COORDINATOR,
+    COUNTY_CODES,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from homeassistant.components.krisinformation.coordinator import STORAGE_KEY
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from . import generate_mock_event
+from .const import MOCK_CONFIG
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.test_util.aiohttp import AiohttpClientMocker
+
+SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+
+async def test_counties_share_feed(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test sensors for several counties are updated from a single request."""
+    other_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG, CONF_COUNTY: COUNTY_CODES["01"]},
+        title="Krisinformation",
+        unique_id=987654321,
+    )
+    other_entry.add_to_hass(hass)
+
+    utcnow = dt_util.utcnow()
+    aioclient_mock.get(
+        VMAS_URL, json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]
+    )
+    with freeze_time(utcnow):
+        # Setting up the domain sets up every entry.
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 1
+        assert sorted(
+            hass.states.get(entity_id).state
+            for entity_id in hass.states.async_entity_ids("sensor")
+        ) == ["No alarms", "Test message"]
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+
+        assert aioclient_mock.call_count == 2
+
+
+async def test_scan_interval_option(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test a changed scan interval is applied without reloading."""
+    utcnow = dt_util.utcnow()
+    aioclient_mock.get(VMAS_URL, json=[])
+    with freeze_time(utcnow):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert aioclient_mock.call_count == 1
+
+        hass.config_entries.async_update_entry(
+            config_entry, options={CONF_SCAN_INTERVAL: 60}
+        )
+        await hass.async_block_till_done()
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+        assert aioclient_mock.call_count == 2
+
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL + timedelta(seconds=60))
+        await hass.async_block_till_done()
+        assert aioclient_mock.call_count == 3
+
+
+async def test_coordinator_shutdown_on_unload(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test the shared coordinator is shut down when the last entry unloads."""
+    aioclient_mock.get(VMAS_URL, json=[])
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.krisinformation.coordinator."
+        "KrisinformationCoordinator.async_shutdown"
+    ) as mock_shutdown:
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    mock_shutdown.assert_called_once()
+    assert COORDINATOR not in hass.data[DOMAIN]
+
+
+async def test_stored_feed_removed_with_last_entry(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test the stored feed is only removed together with the last entry."""
+    other_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG, CONF_COUNTY: COUNTY_CODES["01"]},
+        title="Krisinformation",
+        unique_id=987654321,
+    )
+    other_entry.add_to_hass(hass)
+
+    aioclient_mock.get(
+        VMAS_URL, json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert STORAGE_KEY in hass_storage
+
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert STORAGE_KEY in hass_storage
+
+    await hass.config_entries.async_remove(other_entry.entry_id)
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
@@ -1,38 +1,37 @@
 """Tests for sensor."""
-from unittest.mock import patch
+from datetime import timedelta
 
 from freezegun import freeze_time
 
-from homeassistant.components.krisinformation import generate_mock_event
-from homeassistant.components.krisinformation.const import DOMAIN
-from homeassistant.components.krisinformation.sensor import MIN_TIME_BETWEEN_UPDATES
-from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.components.krisinformation.api import VMAS_URL
+from homeassistant.components.krisinformation.const import (
+    COUNTY_CODES,
+    DEFAULT_SCAN_INTERVAL,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_START, MAX_LENGTH_STATE_STATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 
-from .const import MOCK_CONFIG
+from . import generate_mock_event
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.test_util.aiohttp import AiohttpClientMocker
 
+SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
 
-async def test_entities_added(hass: HomeAssistant) -> None:
-    """Test the entities are added."""
-    config_entry = MockConfigEntry(
-        domain=DOMAIN,
-        data=MOCK_CONFIG,
-        title="Krisinformation",
-        unique_id=123456789,
-    )
-    config_entry.add_to_hass(hass)
 
+async def test_entities_added(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test the entities are added."""
     utcnow = dt_util.utcnow()
-    with freeze_time(utcnow), patch(
-        "krisinformation.crisis_alerter.CrisisAlerter.vmas",
-        is_test=True,
-    ) as mock_vma:
-        mock_vma.return_value = [generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]
-
+    aioclient_mock.get(
+        VMAS_URL, json=[generate_mock_event("Test-VMA-1337-1", "Test VMA 1")]
+    )
+    with freeze_time(utcnow):
         assert await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
 
@@ -45,7 +44,7 @@ async def test_entities_added(hass: HomeAssistant) -> None:
         entity_registry = er.async_get(hass)
         assert len(entity_registry.entities) == 1
 
-        async_fire_time_changed(hass, utcnow + MIN_TIME_BETWEEN_UPDATES)
+        async_fire_time_changed(hass, utcnow + SCAN_INTERVAL)
         await hass.async_block_till_done()
 
         state = hass.states.get(entity_id)
@@ -60,3 +59,47 @@ async def test_entities_added(hass: HomeAssistant) -> None:
             "published": "2023-03-29T11:02:11+02:00",
             "county": "Värmlands län",
         }
+
+
+async def test_alert_after_other_counties(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test the alert for the county is found after alerts for other areas."""
+    other_county = generate_mock_event("Test-VMA-1337-1", "Test VMA 1")
+    other_county["Area"][0]["Description"] = COUNTY_CODES["01"]
+    other_county["PushMessage"] = "Other message"
+    no_area = generate_mock_event("Test-VMA-1337-2", "Test VMA 2")
+    no_area["Area"] = []
+    aioclient_mock.get(
+        VMAS_URL,
+        json=[
+            other_county,
+            no_area,
+            generate_mock_event("Test-VMA-1337-3", "Test VMA 3"),
+        ],
+    )
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = hass.states.async_entity_ids("sensor")[0]
+    assert hass.states.get(entity_id).state == "Test message"
+
+
+async def test_long_message_truncated(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test a message longer than a state can hold is truncated."""
+    event = generate_mock_event("Test-VMA-1337-1", "Test VMA 1")
+    event["PushMessage"] = "A" * (MAX_LENGTH_STATE_STATE + 100)
+    aioclient_mock.get(VMAS_URL, json=[event])
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = hass.states.async_entity_ids("sensor")[0]
+    assert hass.states.get(entity_id).state == "A" * MAX_LENGTH_STATE_STATE